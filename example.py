@@ -30,11 +30,10 @@ def find_sample_data():
     if not os.path.exists(data_dir):
         return None
         
-    # Find all RHS files
-    rhs_files = glob.glob(os.path.join(data_dir, '**', '*.rhs'), recursive=True)
-    
-    # Return the first one if any are found
-    return rhs_files[0] if rhs_files else None
+    # Return the first RHS file found; iglob stops walking the tree at the
+    # first match instead of listing every file under data_dir
+    rhs_files = glob.iglob(os.path.join(data_dir, '**', '*.rhs'), recursive=True)
+    return next(rhs_files, None)
 
 
 def main():
@@ -83,8 +82,9 @@ def main():
         print(f"\nFirst channel: {channel['custom_channel_name']}")
         
         # Print data dimensions if available
-        if result.amplifier_data:
-            print(f"Data shape: {len(result.amplifier_data)} channels x {len(result.amplifier_data[0])} samples")
+        if result.amplifier_data is not None and result.amplifier_data.size:
+            num_channels, num_samples = result.amplifier_data.shape
+            print(f"Data shape: {num_channels} channels x {num_samples} samples")
             print(f"First few values: {result.amplifier_data[0][:5]}")
             print(f"Time (s): {result.t[:5]}")
     
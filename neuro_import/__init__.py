@@ -8,6 +8,6 @@ Intan RHS neurophysiology data files using a Rust backend.
 __version__ = "0.1.0"
 
 # Import the core functionality
-from neuro_import import load_rhs_file
+from neuro_import import load_rhs_file, load_rhs_files
 
-__all__ = ["load_rhs_file"]
\ No newline at end of file
+__all__ = ["load_rhs_file", "load_rhs_files"]
\ No newline at end of file
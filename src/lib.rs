@@ -1,7 +1,13 @@
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::PySlice;
 use intan_importer::{self, load};
+use numpy::ndarray::{Array, Array1, Array2, ArrayView1, Axis, Dimension};
+use numpy::{IntoPyArray, PyArray, PyArray1, PyArray2, PyArrayMethods, PyUntypedArrayMethods};
+use rayon::prelude::*;
 use std::collections::HashMap;
 use std::path::Path;
+use std::sync::atomic::{AtomicUsize, Ordering};
 
 #[pyclass]
 struct RHSResult {
@@ -16,39 +22,510 @@ struct RHSResult {
     #[pyo3(get)]
     stim_parameters: HashMap<String, f32>,
     #[pyo3(get)]
-    amplifier_channels: Vec<HashMap<String, String>>,
+    amplifier_channels: Py<ChannelGroup>,
     #[pyo3(get)]
-    board_adc_channels: Vec<HashMap<String, String>>,
+    board_adc_channels: Py<ChannelGroup>,
     #[pyo3(get)]
-    board_dac_channels: Vec<HashMap<String, String>>,
+    board_dac_channels: Py<ChannelGroup>,
     #[pyo3(get)]
-    board_dig_in_channels: Vec<HashMap<String, String>>,
+    board_dig_in_channels: Py<ChannelGroup>,
     #[pyo3(get)]
-    board_dig_out_channels: Vec<HashMap<String, String>>,
+    board_dig_out_channels: Py<ChannelGroup>,
     #[pyo3(get)]
-    t: Vec<f32>,
+    timestamps: Option<Py<PyArray1<i32>>>,
     #[pyo3(get)]
-    amplifier_data: Option<Vec<Vec<f32>>>,
+    num_samples: usize,
+    sample_rate: f32,
+    t: GILOnceCell<Py<PyArray1<f32>>>,
     #[pyo3(get)]
-    dc_amplifier_data: Option<Vec<Vec<f32>>>,
+    amplifier_data_raw: Option<Py<PyArray2<u16>>>,
+    amplifier_data: GILOnceCell<Py<PyArray2<f32>>>,
     #[pyo3(get)]
-    stim_data: Option<Vec<Vec<f32>>>,
+    dc_amplifier_data_raw: Option<Py<PyArray2<u16>>>,
+    dc_amplifier_data: GILOnceCell<Py<PyArray2<f32>>>,
     #[pyo3(get)]
-    compliance_limit_data: Option<Vec<Vec<bool>>>,
+    stim_data: Option<Py<PyArray2<i16>>>,
     #[pyo3(get)]
-    charge_recovery_data: Option<Vec<Vec<bool>>>,
+    compliance_limit_data: Option<Py<PyArray2<bool>>>,
     #[pyo3(get)]
-    amp_settle_data: Option<Vec<Vec<bool>>>,
+    charge_recovery_data: Option<Py<PyArray2<bool>>>,
     #[pyo3(get)]
-    board_adc_data: Option<Vec<Vec<f32>>>,
+    amp_settle_data: Option<Py<PyArray2<bool>>>,
     #[pyo3(get)]
-    board_dac_data: Option<Vec<Vec<f32>>>,
+    board_adc_data_raw: Option<Py<PyArray2<u16>>>,
+    board_adc_data: GILOnceCell<Py<PyArray2<f32>>>,
     #[pyo3(get)]
-    board_dig_in_data: Option<Vec<Vec<bool>>>,
+    board_dac_data_raw: Option<Py<PyArray2<u16>>>,
+    board_dac_data: GILOnceCell<Py<PyArray2<f32>>>,
     #[pyo3(get)]
-    board_dig_out_data: Option<Vec<Vec<bool>>>,
+    board_dig_in_raw: Option<Py<PyArray1<u16>>>,
+    board_dig_in_masks: DigitalMasks,
+    board_dig_in_data: GILOnceCell<Py<PyArray2<bool>>>,
+    #[pyo3(get)]
+    board_dig_out_raw: Option<Py<PyArray1<u16>>>,
+    board_dig_out_masks: DigitalMasks,
+    board_dig_out_data: GILOnceCell<Py<PyArray2<bool>>>,
     #[pyo3(get)]
     spike_triggers: Vec<HashMap<String, f32>>,
+    channel_index: HashMap<String, (&'static str, usize)>,
+}
+
+#[pymethods]
+impl RHSResult {
+    /// Look up a channel by its custom name.
+    ///
+    /// Returns a `(group_name, index)` tuple such as `("amplifier_channels", 3)`,
+    /// or `None` if no channel has that name. The lookup uses a table built
+    /// once at load time, so it does not scan the channel groups.
+    fn find_channel(&self, channel_name: &str) -> Option<(&'static str, usize)> {
+        self.channel_index.get(channel_name).copied()
+    }
+
+    /// Names of the data attributes that hold data for this file.
+    ///
+    /// Attributes that are not listed hold no data (`None`, or an empty
+    /// array, e.g. `board_adc_data` for a file without ADC channels), so
+    /// callers can iterate over this list instead of probing every data
+    /// attribute with `hasattr` and `getattr`.
+    fn available_data_fields(&self, py: Python<'_>) -> Vec<&'static str> {
+        DataSizes {
+            timestamps: num_elements(py, &self.timestamps),
+            amplifier: num_elements(py, &self.amplifier_data_raw),
+            dc_amplifier: num_elements(py, &self.dc_amplifier_data_raw),
+            stim: num_elements(py, &self.stim_data),
+            board_adc: num_elements(py, &self.board_adc_data_raw),
+            board_dac: num_elements(py, &self.board_dac_data_raw),
+            board_dig_in: DigitalPortSize {
+                channels: self.board_dig_in_channels.borrow(py).len,
+                words: num_elements(py, &self.board_dig_in_raw),
+                decodable: self.board_dig_in_masks.is_ok(),
+            },
+            board_dig_out: DigitalPortSize {
+                channels: self.board_dig_out_channels.borrow(py).len,
+                words: num_elements(py, &self.board_dig_out_raw),
+                decodable: self.board_dig_out_masks.is_ok(),
+            },
+        }
+        .available_fields()
+    }
+
+    /// Time of each sample in seconds, computed from `timestamps` on first access.
+    #[getter]
+    fn t(&self, py: Python<'_>) -> Py<PyArray1<f32>> {
+        self.t
+            .get_or_init(py, || {
+                // Convert timestamps to seconds
+                let t: Array1<f32> = match &self.timestamps {
+                    Some(timestamps) => timestamps.bind(py).readonly().as_array().iter()
+                        .map(|&t| t as f32 / self.sample_rate)
+                        .collect(),
+                    None => Array1::zeros(0),
+                };
+                t.into_pyarray(py).unbind()
+            })
+            .clone_ref(py)
+    }
+
+    /// Amplifier data in microvolts, scaled from `amplifier_data_raw` on first access.
+    #[getter]
+    fn amplifier_data(&self, py: Python<'_>) -> Option<Py<PyArray2<f32>>> {
+        scaled_data(py, &self.amplifier_data_raw, &self.amplifier_data, AMPLIFIER_SCALING)
+    }
+
+    /// DC amplifier data in volts, scaled from `dc_amplifier_data_raw` on first access.
+    #[getter]
+    fn dc_amplifier_data(&self, py: Python<'_>) -> Option<Py<PyArray2<f32>>> {
+        scaled_data(py, &self.dc_amplifier_data_raw, &self.dc_amplifier_data, DC_AMPLIFIER_SCALING)
+    }
+
+    /// Board ADC data in volts, scaled from `board_adc_data_raw` on first access.
+    #[getter]
+    fn board_adc_data(&self, py: Python<'_>) -> Option<Py<PyArray2<f32>>> {
+        scaled_data(py, &self.board_adc_data_raw, &self.board_adc_data, BOARD_ANALOG_SCALING)
+    }
+
+    /// Board DAC data in volts, scaled from `board_dac_data_raw` on first access.
+    #[getter]
+    fn board_dac_data(&self, py: Python<'_>) -> Option<Py<PyArray2<f32>>> {
+        scaled_data(py, &self.board_dac_data_raw, &self.board_dac_data, BOARD_ANALOG_SCALING)
+    }
+
+    /// Digital input states, one row per channel, unpacked from `board_dig_in_raw` on first access.
+    #[getter]
+    fn board_dig_in_data(&self, py: Python<'_>) -> PyResult<Option<Py<PyArray2<bool>>>> {
+        digital_data(py, &self.board_dig_in_raw, &self.board_dig_in_masks, &self.board_dig_in_data)
+    }
+
+    /// Digital output states, one row per channel, unpacked from `board_dig_out_raw` on first access.
+    #[getter]
+    fn board_dig_out_data(&self, py: Python<'_>) -> PyResult<Option<Py<PyArray2<bool>>>> {
+        digital_data(py, &self.board_dig_out_raw, &self.board_dig_out_masks, &self.board_dig_out_data)
+    }
+}
+
+/// Number of elements in a data attribute, or 0 if it is `None`.
+fn num_elements<T: numpy::Element, D: Dimension>(py: Python<'_>, array: &Option<Py<PyArray<T, D>>>) -> usize {
+    array.as_ref().map_or(0, |array| array.bind(py).len())
+}
+
+/// Element counts of a result's data blocks, from which
+/// `available_data_fields` decides which attributes hold data.
+#[derive(Default)]
+struct DataSizes {
+    timestamps: usize,
+    amplifier: usize,
+    dc_amplifier: usize,
+    stim: usize,
+    board_adc: usize,
+    board_dac: usize,
+    board_dig_in: DigitalPortSize,
+    board_dig_out: DigitalPortSize,
+}
+
+#[derive(Default)]
+struct DigitalPortSize {
+    channels: usize,
+    words: usize,
+    /// Whether the channel masks could be built, so the port can be unpacked.
+    decodable: bool,
+}
+
+impl DataSizes {
+    fn available_fields(&self) -> Vec<&'static str> {
+        let mut fields = Vec::new();
+        
+        if self.timestamps > 0 {
+            fields.extend(["t", "timestamps"]);
+        }
+        if self.amplifier > 0 {
+            fields.extend(["amplifier_data", "amplifier_data_raw"]);
+        }
+        if self.dc_amplifier > 0 {
+            fields.extend(["dc_amplifier_data", "dc_amplifier_data_raw"]);
+        }
+        if self.stim > 0 {
+            fields.extend(["stim_data", "compliance_limit_data", "charge_recovery_data", "amp_settle_data"]);
+        }
+        if self.board_adc > 0 {
+            fields.extend(["board_adc_data", "board_adc_data_raw"]);
+        }
+        if self.board_dac > 0 {
+            fields.extend(["board_dac_data", "board_dac_data_raw"]);
+        }
+        // A port whose channel bits cannot be decoded still lists its raw
+        // words, but not the unpacked data, whose getter would raise
+        for (port, data_field, raw_field) in [
+            (&self.board_dig_in, "board_dig_in_data", "board_dig_in_raw"),
+            (&self.board_dig_out, "board_dig_out_data", "board_dig_out_raw"),
+        ] {
+            if port.channels > 0 && port.words > 0 {
+                if port.decodable {
+                    fields.push(data_field);
+                }
+                fields.push(raw_field);
+            }
+        }
+        
+        fields
+    }
+}
+
+/// Affine conversion from a raw 16-bit sample to physical units,
+/// `gain * (sample - offset)`, evaluated in single precision.
+#[derive(Clone, Copy)]
+struct Scaling {
+    offset: i32,
+    gain: f32,
+}
+
+impl Scaling {
+    #[inline]
+    fn apply(self, sample: u16) -> f32 {
+        self.gain * (sample as i32 - self.offset) as f32
+    }
+}
+
+// Scale to microvolts: 0.195 * (sample - 32768)
+const AMPLIFIER_SCALING: Scaling = Scaling { offset: 32768, gain: 0.195 };
+// Scale to volts: -0.01923 * (sample - 512)
+const DC_AMPLIFIER_SCALING: Scaling = Scaling { offset: 512, gain: -0.01923 };
+// Scale to volts: 312.5e-6 * (sample - 32768)
+const BOARD_ANALOG_SCALING: Scaling = Scaling { offset: 32768, gain: 312.5e-6 };
+
+/// Return the scaled version of a raw data block, computing it on first use.
+///
+/// The scaled array is cached in `scaled`, so later accesses return the same
+/// NumPy array without rescaling. Only shared borrows are involved, so other
+/// threads can keep using the result while the GIL is released for scaling;
+/// if two threads race to fill the cache, the first array stored is kept.
+fn scaled_data(
+    py: Python<'_>,
+    raw: &Option<Py<PyArray2<u16>>>,
+    scaled: &GILOnceCell<Py<PyArray2<f32>>>,
+    scaling: Scaling,
+) -> Option<Py<PyArray2<f32>>> {
+    let raw = raw.as_ref()?;
+    
+    let scaled = scaled.get_or_init(py, || {
+        let raw = raw.bind(py).readonly();
+        let raw = raw.as_array();
+        let (num_channels, num_samples) = raw.dim();
+        
+        let array = py.allow_threads(|| {
+            fill_rows(num_channels, num_samples, |i, row| {
+                scale_samples(raw.row(i), row, scaling);
+            })
+        });
+        into_numpy(py, array)
+    });
+    
+    Some(scaled.clone_ref(py))
+}
+
+/// Scale one channel of raw samples into `output`.
+///
+/// Widening, offset subtraction, conversion and multiplication happen in a
+/// single pass. On contiguous input this is a plain zip over two slices with
+/// no bounds checks, which LLVM compiles to SIMD code.
+fn scale_samples(input: ArrayView1<'_, u16>, output: &mut [f32], scaling: Scaling) {
+    match input.as_slice() {
+        Some(input) => {
+            for (value, &sample) in output.iter_mut().zip(input) {
+                *value = scaling.apply(sample);
+            }
+        }
+        None => {
+            for (value, &sample) in output.iter_mut().zip(input.iter()) {
+                *value = scaling.apply(sample);
+            }
+        }
+    }
+}
+
+/// Return the per-channel states of a digital port, unpacking them on first use.
+///
+/// Each raw word holds one bit per channel, at the channel's native order;
+/// `masks` holds the matching single-bit mask for each channel, or the
+/// reason they could not be built, which is raised as a `ValueError`. The
+/// unpacked array is cached in `unpacked`, which like `scaled_data` needs no
+/// mutable borrow of the result while the GIL is released.
+fn digital_data(
+    py: Python<'_>,
+    raw: &Option<Py<PyArray1<u16>>>,
+    masks: &DigitalMasks,
+    unpacked: &GILOnceCell<Py<PyArray2<bool>>>,
+) -> PyResult<Option<Py<PyArray2<bool>>>> {
+    let Some(raw) = raw.as_ref() else {
+        return Ok(None);
+    };
+    let masks = masks.as_ref().map_err(|e| pyo3::exceptions::PyValueError::new_err(e.clone()))?;
+    
+    let unpacked = unpacked.get_or_init(py, || {
+        let raw = raw.bind(py).readonly();
+        let words = raw.as_array();
+        
+        let array = if masks.is_empty() || words.is_empty() {
+            Array2::from_elem((0, 0), false)
+        } else {
+            py.allow_threads(|| unpack_digital_words(words, masks))
+        };
+        into_numpy(py, array)
+    });
+    
+    Ok(Some(unpacked.clone_ref(py)))
+}
+
+/// Number of samples unpacked per tile by `unpack_digital_words`. A tile of
+/// words (8 KiB) stays in L1 cache while it is fanned out to every channel.
+const DIGITAL_TILE_SAMPLES: usize = 4096;
+
+/// Unpack packed digital words into one row of states per channel.
+///
+/// The samples are split into tiles that are processed in parallel. Each
+/// tile reads its words once and writes the matching segment of every
+/// channel row, instead of re-reading the whole word array per channel.
+fn unpack_digital_words(words: ArrayView1<'_, u16>, masks: &[u16]) -> Array2<bool> {
+    let mut result = Array2::from_elem((masks.len(), words.len()), false);
+    
+    let tiles: Vec<_> = result
+        .axis_chunks_iter_mut(Axis(1), DIGITAL_TILE_SAMPLES)
+        .zip(words.axis_chunks_iter(Axis(0), DIGITAL_TILE_SAMPLES))
+        .collect();
+    
+    tiles.into_par_iter().for_each(|(mut tile, tile_words)| {
+        for (mut row, &mask) in tile.outer_iter_mut().zip(masks) {
+            for (value, &word) in row.iter_mut().zip(tile_words.iter()) {
+                *value = (word & mask) != 0;
+            }
+        }
+    });
+    
+    result
+}
+
+/// Channel properties for one signal group, stored column by column.
+///
+/// Each property (e.g. `custom_channel_name`) is held once as a typed
+/// column instead of building one dictionary per channel. Indexing, slicing
+/// or iterating the group still yields the per-channel dictionaries of
+/// strings, built on demand, so `group[i]['custom_channel_name']` keeps
+/// working. The group is not a list, though: use `list(group)` for
+/// comparison, pickling or JSON.
+#[pyclass]
+struct ChannelGroup {
+    columns: Vec<(&'static str, Column)>,
+    len: usize,
+}
+
+/// One property for every channel of a group.
+enum Column {
+    Text(Vec<String>),
+    Int(Vec<i32>),
+    Float(Vec<f32>),
+}
+
+impl Column {
+    fn len(&self) -> usize {
+        match self {
+            Column::Text(values) => values.len(),
+            Column::Int(values) => values.len(),
+            Column::Float(values) => values.len(),
+        }
+    }
+
+    /// One channel's value, formatted as in the per-channel dictionaries.
+    fn format(&self, index: usize) -> String {
+        match self {
+            Column::Text(values) => values[index].clone(),
+            Column::Int(values) => values[index].to_string(),
+            Column::Float(values) => values[index].to_string(),
+        }
+    }
+}
+
+impl ChannelGroup {
+    fn new(len: usize) -> Self {
+        ChannelGroup { columns: Vec::new(), len }
+    }
+
+    fn push_column(&mut self, name: &'static str, values: Column) {
+        debug_assert_eq!(values.len(), self.len);
+        self.columns.push((name, values));
+    }
+
+    fn values(&self, name: &str) -> Option<&Column> {
+        self.columns
+            .iter()
+            .find(|(column_name, _)| *column_name == name)
+            .map(|(_, values)| values)
+    }
+
+    fn text(&self, name: &str) -> Option<&[String]> {
+        match self.values(name)? {
+            Column::Text(values) => Some(values),
+            _ => None,
+        }
+    }
+
+    fn channel(&self, index: usize) -> Option<HashMap<String, String>> {
+        if index >= self.len {
+            return None;
+        }
+        Some(
+            self.columns
+                .iter()
+                .map(|(name, values)| (name.to_string(), values.format(index)))
+                .collect(),
+        )
+    }
+}
+
+#[pymethods]
+impl ChannelGroup {
+    fn __len__(&self) -> usize {
+        self.len
+    }
+
+    /// Return one channel's dictionary, or a list of them for a slice,
+    /// as indexing the former list of channels did.
+    fn __getitem__(&self, index: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        let py = index.py();
+        
+        if let Ok(slice) = index.downcast::<PySlice>() {
+            let indices = slice.indices(self.len as isize)?;
+            let channels: Vec<HashMap<String, String>> =
+                slice_positions(indices.start, indices.step, indices.slicelength as usize)
+                    .map(|position| self.channel(position).expect("slice indices are within the group"))
+                    .collect();
+            return Ok(channels.into_pyobject(py)?.unbind());
+        }
+        
+        let index: isize = index.extract()?;
+        let channel = resolve_index(index, self.len)
+            .and_then(|position| self.channel(position))
+            .ok_or_else(|| pyo3::exceptions::PyIndexError::new_err("channel index out of range"))?;
+        Ok(channel.into_pyobject(py)?.into_any().unbind())
+    }
+
+    fn __iter__(slf: PyRef<'_, Self>) -> ChannelGroupIter {
+        ChannelGroupIter { group: slf.into(), index: 0 }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("ChannelGroup({} channels)", self.len)
+    }
+
+    /// Names of the per-channel properties in this group.
+    fn keys(&self) -> Vec<&'static str> {
+        self.columns.iter().map(|(name, _)| *name).collect()
+    }
+
+    /// Return one property for every channel in the group, in channel order.
+    ///
+    /// Numeric properties (orders, `chip_channel`, `board_stream`,
+    /// `port_number`) come back as int32 NumPy arrays and impedances as
+    /// float32 arrays, so channels can be selected with vectorized
+    /// comparisons. Text properties come back as lists of strings.
+    fn column(&self, py: Python<'_>, name: &str) -> PyResult<PyObject> {
+        match self.values(name) {
+            Some(Column::Text(values)) => Ok(values.clone().into_pyobject(py)?.unbind()),
+            Some(Column::Int(values)) => Ok(PyArray1::from_slice(py, values).into_any().unbind()),
+            Some(Column::Float(values)) => Ok(PyArray1::from_slice(py, values).into_any().unbind()),
+            None => Err(pyo3::exceptions::PyKeyError::new_err(name.to_string())),
+        }
+    }
+}
+
+/// Position of a Python-style index in a group of `len` channels, counting
+/// from the end for negative indices, or `None` if it is out of range.
+fn resolve_index(index: isize, len: usize) -> Option<usize> {
+    let position = if index < 0 { index + len as isize } else { index };
+    usize::try_from(position).ok().filter(|&position| position < len)
+}
+
+/// Positions selected by a slice, given the `start`, `step` and length that
+/// `PySlice::indices` normalized against the group length.
+fn slice_positions(start: isize, step: isize, count: usize) -> impl Iterator<Item = usize> {
+    (0..count).map(move |k| (start + k as isize * step) as usize)
+}
+
+#[pyclass]
+struct ChannelGroupIter {
+    group: Py<ChannelGroup>,
+    index: usize,
+}
+
+#[pymethods]
+impl ChannelGroupIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> Option<HashMap<String, String>> {
+        let channel = slf.group.borrow(slf.py()).channel(slf.index);
+        slf.index += 1;
+        channel
+    }
 }
 
 /// Load an Intan RHS file using the Rust-based implementation.
@@ -56,87 +533,320 @@ struct RHSResult {
 /// This function provides a high-performance implementation for reading and parsing
 /// Intan RHS files, using the intan_importer Rust crate.
 #[pyfunction]
-fn load_rhs_file(_py: Python<'_>, filename: &str) -> PyResult<RHSResult> {
-    // Check if file exists
+fn load_rhs_file(py: Python<'_>, filename: &str) -> PyResult<RHSResult> {
+    check_file_exists(filename)?;
+
+    // Parse and convert the file with the GIL released, so other Python
+    // threads keep running while the loader works
+    let converted = py.allow_threads(|| convert_file(filename)).map_err(|e| {
+        pyo3::exceptions::PyIOError::new_err(format!("Error loading RHS file: {}", e))
+    })?;
+
+    into_result(py, converted)
+}
+
+/// Load several Intan RHS files in parallel.
+///
+/// Files are parsed concurrently with the GIL released, and the results are
+/// returned in the same order as `filenames`. At most `max_workers` files
+/// are parsed at once (default: the number of CPUs), which bounds the
+/// parser's intermediate buffers, e.g. to limit peak memory with very large
+/// recordings. Each file's channels are still converted on the shared Rayon
+/// thread pool.
+#[pyfunction]
+#[pyo3(signature = (filenames, max_workers=None))]
+fn load_rhs_files(py: Python<'_>, filenames: Vec<String>, max_workers: Option<usize>) -> PyResult<Vec<RHSResult>> {
+    let max_workers = match max_workers {
+        Some(0) => {
+            return Err(pyo3::exceptions::PyValueError::new_err("max_workers must be at least 1"));
+        }
+        Some(max_workers) => max_workers,
+        None => std::thread::available_parallelism().map_or(1, |n| n.get()),
+    };
+    
+    // Check that every file exists before starting any work
+    for filename in &filenames {
+        check_file_exists(filename)?;
+    }
+
+    let converted = py.allow_threads(|| convert_files(&filenames, max_workers, convert_file));
+
+    converted
+        .into_iter()
+        .zip(&filenames)
+        .map(|(converted, filename)| {
+            let converted = converted.map_err(|e| {
+                pyo3::exceptions::PyIOError::new_err(format!("Error loading RHS file {}: {}", filename, e))
+            })?;
+            into_result(py, converted)
+        })
+        .collect()
+}
+
+/// Convert files with `convert`, with at most `max_workers` of them in
+/// progress at once, returning the results in the order of `filenames`.
+///
+/// Each worker thread takes the next unclaimed file and converts it fully
+/// before claiming another. Running the files on a Rayon pool would not give
+/// this bound: a pool thread waiting on a file's nested channel work can
+/// steal and start another file.
+fn convert_files<T, F>(filenames: &[String], max_workers: usize, convert: F) -> Vec<Result<T, String>>
+where
+    T: Send,
+    F: Fn(&str) -> Result<T, String> + Sync,
+{
+    let next_file = AtomicUsize::new(0);
+    let mut converted: Vec<Option<Result<T, String>>> = filenames.iter().map(|_| None).collect();
+    
+    std::thread::scope(|scope| {
+        let workers: Vec<_> = (0..max_workers.min(filenames.len()))
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut done = Vec::new();
+                    loop {
+                        let i = next_file.fetch_add(1, Ordering::Relaxed);
+                        let Some(filename) = filenames.get(i) else { break };
+                        done.push((i, convert(filename)));
+                    }
+                    done
+                })
+            })
+            .collect();
+        
+        for worker in workers {
+            let done = worker.join().unwrap_or_else(|panic| std::panic::resume_unwind(panic));
+            for (i, result) in done {
+                converted[i] = Some(result);
+            }
+        }
+    });
+    
+    converted
+        .into_iter()
+        .map(|result| result.expect("every file is claimed by a worker"))
+        .collect()
+}
+
+fn check_file_exists(filename: &str) -> PyResult<()> {
     if !Path::new(filename).exists() {
         return Err(pyo3::exceptions::PyFileNotFoundError::new_err(
             format!("File not found: {}", filename),
         ));
     }
+    
+    Ok(())
+}
 
+/// An RHS file converted to plain Rust data, ready to be handed to Python.
+///
+/// Building this touches no Python objects, so it can be done without the GIL.
+struct ConvertedFile {
+    data_present: bool,
+    sample_rate: f32,
+    frequency_parameters: HashMap<String, f32>,
+    notes: HashMap<String, String>,
+    reference_channel: String,
+    stim_parameters: HashMap<String, f32>,
+    amplifier_channels: ChannelGroup,
+    board_adc_channels: ChannelGroup,
+    board_dac_channels: ChannelGroup,
+    board_dig_in_channels: ChannelGroup,
+    board_dig_out_channels: ChannelGroup,
+    board_dig_in_masks: DigitalMasks,
+    board_dig_out_masks: DigitalMasks,
+    spike_triggers: Vec<HashMap<String, f32>>,
+    channel_index: HashMap<String, (&'static str, usize)>,
+    data: Option<ConvertedData>,
+}
+
+struct ConvertedData {
+    timestamps: Array1<i32>,
+    amplifier_data_raw: Array2<u16>,
+    dc_amplifier_data_raw: Option<Array2<u16>>,
+    stim: StimDataConversion,
+    board_adc_data_raw: Array2<u16>,
+    board_dac_data_raw: Array2<u16>,
+    board_dig_in_raw: Array1<u16>,
+    board_dig_out_raw: Array1<u16>,
+}
+
+fn convert_file(filename: &str) -> Result<ConvertedFile, String> {
     // Load file using intan_importer crate
-    let rhs_file = match load(filename) {
-        Ok(file) => file,
-        Err(e) => {
-            return Err(pyo3::exceptions::PyIOError::new_err(
-                format!("Error loading RHS file: {}", e),
-            ));
-        }
-    };
+    let mut rhs_file = load(filename).map_err(|e| e.to_string())?;
 
     // Extract header and data from the loaded file
     let header = &rhs_file.header;
     let data_present = rhs_file.data_present;
     
-    // Convert header and data to Python objects
-    let mut result = RHSResult {
+    let amplifier_channels = convert_amplifier_channels(header);
+    let board_adc_channels = convert_board_adc_channels(header);
+    let board_dac_channels = convert_board_dac_channels(header);
+    let board_dig_in_channels = convert_board_dig_in_channels(header);
+    let board_dig_out_channels = convert_board_dig_out_channels(header);
+    let channel_index = build_channel_index(&[
+        ("amplifier_channels", &amplifier_channels),
+        ("board_adc_channels", &board_adc_channels),
+        ("board_dac_channels", &board_dac_channels),
+        ("board_dig_in_channels", &board_dig_in_channels),
+        ("board_dig_out_channels", &board_dig_out_channels),
+    ]);
+
+    // Process data if present
+    let data = if data_present {
+        // Take ownership of the raw data so each block can be released as
+        // soon as it has been converted, rather than holding the raw and
+        // converted copies of the whole recording until the end of the load.
+        let mut data = rhs_file.data.take().unwrap();
+        
+        // Keep the integer sample timestamps; the time axis in seconds is
+        // only materialized if Python asks for `t`
+        let timestamps: Array1<i32> = data.timestamps.iter()
+            .map(|&t| t as i32)
+            .collect();
+        
+        // Sample data is kept as raw 16-bit words; scaling to physical
+        // units happens on first access from Python
+        let amplifier_data_raw = convert_amplifier_data(&mut data);
+        let dc_amplifier_data_raw = if header.dc_amplifier_data_saved {
+            Some(convert_dc_amplifier_data(&mut data))
+        } else {
+            None
+        };
+        let stim = convert_stim_data(&mut data);
+        
+        Some(ConvertedData {
+            timestamps,
+            amplifier_data_raw,
+            dc_amplifier_data_raw,
+            stim,
+            board_adc_data_raw: convert_board_adc_data(&mut data),
+            board_dac_data_raw: convert_board_dac_data(&mut data),
+            board_dig_in_raw: convert_board_dig_in_raw(&mut data),
+            board_dig_out_raw: convert_board_dig_out_raw(&mut data),
+        })
+    } else {
+        None
+    };
+
+    Ok(ConvertedFile {
         data_present,
+        sample_rate: header.sample_rate,
         frequency_parameters: convert_frequency_parameters(header),
         notes: convert_notes(header),
         reference_channel: header.reference_channel.clone(),
         stim_parameters: convert_stim_parameters(header),
-        amplifier_channels: convert_amplifier_channels(header),
-        board_adc_channels: convert_board_adc_channels(header),
-        board_dac_channels: convert_board_dac_channels(header),
-        board_dig_in_channels: convert_board_dig_in_channels(header),
-        board_dig_out_channels: convert_board_dig_out_channels(header),
-        t: Vec::new(), // Will be populated if data is present
-        amplifier_data: None,
-        dc_amplifier_data: None,
+        amplifier_channels,
+        board_adc_channels,
+        board_dac_channels,
+        board_dig_in_channels,
+        board_dig_out_channels,
+        // Precompute each digital channel's bit mask once per file
+        board_dig_in_masks: digital_masks(header.board_dig_in_channels.iter().map(|c| c.native_order as i64)),
+        board_dig_out_masks: digital_masks(header.board_dig_out_channels.iter().map(|c| c.native_order as i64)),
+        spike_triggers: convert_spike_triggers(header),
+        channel_index,
+        data,
+    })
+}
+
+/// Single-bit masks selecting each digital channel from the packed 16-bit
+/// words of one port, or the reason they cannot be built.
+type DigitalMasks = Result<Vec<u16>, String>;
+
+/// Build the masks for a port from its channels' native orders.
+///
+/// A native order outside 0..16 cannot name a bit of the word, so it is
+/// reported as an error rather than shifted into the wrong bit. The error is
+/// only raised when the port's unpacked data is read, so the rest of the
+/// file stays usable.
+fn digital_masks(native_orders: impl Iterator<Item = i64>) -> DigitalMasks {
+    native_orders
+        .map(|native_order| {
+            u32::try_from(native_order)
+                .ok()
+                .and_then(|bit| 1u16.checked_shl(bit))
+                .ok_or_else(|| format!("Invalid digital channel native order: {}", native_order))
+        })
+        .collect()
+}
+
+/// Wrap a converted file in Python objects.
+fn into_result(py: Python<'_>, converted: ConvertedFile) -> PyResult<RHSResult> {
+    let mut result = RHSResult {
+        data_present: converted.data_present,
+        frequency_parameters: converted.frequency_parameters,
+        notes: converted.notes,
+        reference_channel: converted.reference_channel,
+        stim_parameters: converted.stim_parameters,
+        amplifier_channels: Py::new(py, converted.amplifier_channels)?,
+        board_adc_channels: Py::new(py, converted.board_adc_channels)?,
+        board_dac_channels: Py::new(py, converted.board_dac_channels)?,
+        board_dig_in_channels: Py::new(py, converted.board_dig_in_channels)?,
+        board_dig_out_channels: Py::new(py, converted.board_dig_out_channels)?,
+        timestamps: None, // Will be populated if data is present
+        num_samples: 0,
+        sample_rate: converted.sample_rate,
+        t: GILOnceCell::new(),
+        amplifier_data_raw: None,
+        amplifier_data: GILOnceCell::new(),
+        dc_amplifier_data_raw: None,
+        dc_amplifier_data: GILOnceCell::new(),
         stim_data: None,
         compliance_limit_data: None,
         charge_recovery_data: None,
         amp_settle_data: None,
-        board_adc_data: None,
-        board_dac_data: None,
-        board_dig_in_data: None,
-        board_dig_out_data: None,
-        spike_triggers: convert_spike_triggers(header),
+        board_adc_data_raw: None,
+        board_adc_data: GILOnceCell::new(),
+        board_dac_data_raw: None,
+        board_dac_data: GILOnceCell::new(),
+        board_dig_in_raw: None,
+        board_dig_in_masks: converted.board_dig_in_masks,
+        board_dig_in_data: GILOnceCell::new(),
+        board_dig_out_raw: None,
+        board_dig_out_masks: converted.board_dig_out_masks,
+        board_dig_out_data: GILOnceCell::new(),
+        spike_triggers: converted.spike_triggers,
+        channel_index: converted.channel_index,
     };
 
-    // Process data if present
-    if data_present {
-        let data = rhs_file.data.as_ref().unwrap();
+    if let Some(data) = converted.data {
+        // Each array is handed to NumPy by ownership transfer, so no copy of
+        // the sample buffers is made. The arrays that lazily computed
+        // attributes are derived from are read-only, so their caches cannot
+        // disagree with their source.
+        result.num_samples = data.timestamps.len();
+        result.timestamps = Some(into_readonly_numpy(py, data.timestamps)?);
+        result.amplifier_data_raw = Some(into_readonly_numpy(py, data.amplifier_data_raw)?);
+        result.dc_amplifier_data_raw = data.dc_amplifier_data_raw
+            .map(|array| into_readonly_numpy(py, array))
+            .transpose()?;
         
-        // Convert timestamps to seconds
-        result.t = data.timestamps.iter()
-            .map(|&t| t as f32 / header.sample_rate)
-            .collect();
-            
-        // Process and convert other data types
-        result.amplifier_data = Some(convert_amplifier_data(data));
-        
-        if header.dc_amplifier_data_saved {
-            result.dc_amplifier_data = Some(convert_dc_amplifier_data(data));
-        }
+        result.stim_data = Some(into_numpy(py, data.stim.stim_data));
+        result.compliance_limit_data = Some(into_numpy(py, data.stim.compliance_limit_data));
+        result.charge_recovery_data = Some(into_numpy(py, data.stim.charge_recovery_data));
+        result.amp_settle_data = Some(into_numpy(py, data.stim.amp_settle_data));
         
-        // Convert stimulation data
-        let stim_conversion = convert_stim_data(data);
-        result.stim_data = Some(stim_conversion.stim_data);
-        result.compliance_limit_data = Some(stim_conversion.compliance_limit_data);
-        result.charge_recovery_data = Some(stim_conversion.charge_recovery_data);
-        result.amp_settle_data = Some(stim_conversion.amp_settle_data);
-        
-        // Convert board data
-        result.board_adc_data = Some(convert_board_adc_data(data));
-        result.board_dac_data = Some(convert_board_dac_data(data));
-        result.board_dig_in_data = Some(convert_board_dig_in_raw(data, header));
-        result.board_dig_out_data = Some(convert_board_dig_out_raw(data, header));
+        result.board_adc_data_raw = Some(into_readonly_numpy(py, data.board_adc_data_raw)?);
+        result.board_dac_data_raw = Some(into_readonly_numpy(py, data.board_dac_data_raw)?);
+        result.board_dig_in_raw = Some(into_readonly_numpy(py, data.board_dig_in_raw)?);
+        result.board_dig_out_raw = Some(into_readonly_numpy(py, data.board_dig_out_raw)?);
     }
 
     Ok(result)
 }
 
+/// Move an owned 2D array into a NumPy array without copying its buffer.
+fn into_numpy<T: numpy::Element>(py: Python<'_>, array: Array2<T>) -> Py<PyArray2<T>> {
+    array.into_pyarray(py).unbind()
+}
+
+/// Move an owned array into a read-only NumPy array without copying its buffer.
+fn into_readonly_numpy<T: numpy::Element, D: Dimension>(py: Python<'_>, array: Array<T, D>) -> PyResult<Py<PyArray<T, D>>> {
+    let array = array.into_pyarray(py);
+    array.call_method1("setflags", (false,))?;
+    Ok(array.unbind())
+}
+
 // Helper functions for converting Rust data structures to Python equivalents
 fn convert_frequency_parameters(header: &intan_importer::RhsHeader) -> HashMap<String, f32> {
     let mut freq_params = HashMap::new();
@@ -188,117 +898,97 @@ fn convert_stim_parameters(header: &intan_importer::RhsHeader) -> HashMap<String
     stim_params
 }
 
-fn convert_amplifier_channels(header: &intan_importer::RhsHeader) -> Vec<HashMap<String, String>> {
-    let mut channels = Vec::new();
+fn convert_amplifier_channels(header: &intan_importer::RhsHeader) -> ChannelGroup {
+    let channels = &header.amplifier_channels;
+    let mut group = ChannelGroup::new(channels.len());
     
-    for channel in &header.amplifier_channels {
-        let mut channel_dict = HashMap::new();
-        channel_dict.insert("native_channel_name".to_string(), channel.native_channel_name.clone());
-        channel_dict.insert("custom_channel_name".to_string(), channel.custom_channel_name.clone());
-        channel_dict.insert("native_order".to_string(), channel.native_order.to_string());
-        channel_dict.insert("custom_order".to_string(), channel.custom_order.to_string());
-        channel_dict.insert("chip_channel".to_string(), channel.chip_channel.to_string());
-        channel_dict.insert("board_stream".to_string(), channel.board_stream.to_string());
-        channel_dict.insert("electrode_impedance_magnitude".to_string(), channel.electrode_impedance_magnitude.to_string());
-        channel_dict.insert("electrode_impedance_phase".to_string(), channel.electrode_impedance_phase.to_string());
-        
-        // Add port information
-        channel_dict.insert("port_name".to_string(), channel.port_name.clone());
-        channel_dict.insert("port_prefix".to_string(), channel.port_prefix.clone());
-        channel_dict.insert("port_number".to_string(), channel.port_number.to_string());
-        
-        channels.push(channel_dict);
-    }
+    group.push_column("native_channel_name", Column::Text(channels.iter().map(|c| c.native_channel_name.clone()).collect()));
+    group.push_column("custom_channel_name", Column::Text(channels.iter().map(|c| c.custom_channel_name.clone()).collect()));
+    group.push_column("native_order", Column::Int(channels.iter().map(|c| c.native_order as i32).collect()));
+    group.push_column("custom_order", Column::Int(channels.iter().map(|c| c.custom_order as i32).collect()));
+    group.push_column("chip_channel", Column::Int(channels.iter().map(|c| c.chip_channel as i32).collect()));
+    group.push_column("board_stream", Column::Int(channels.iter().map(|c| c.board_stream as i32).collect()));
+    group.push_column("electrode_impedance_magnitude", Column::Float(channels.iter().map(|c| c.electrode_impedance_magnitude as f32).collect()));
+    group.push_column("electrode_impedance_phase", Column::Float(channels.iter().map(|c| c.electrode_impedance_phase as f32).collect()));
+    
+    // Add port information
+    group.push_column("port_name", Column::Text(channels.iter().map(|c| c.port_name.clone()).collect()));
+    group.push_column("port_prefix", Column::Text(channels.iter().map(|c| c.port_prefix.clone()).collect()));
+    group.push_column("port_number", Column::Int(channels.iter().map(|c| c.port_number as i32).collect()));
     
-    channels
+    group
 }
 
-fn convert_board_adc_channels(header: &intan_importer::RhsHeader) -> Vec<HashMap<String, String>> {
-    let mut channels = Vec::new();
+fn convert_board_adc_channels(header: &intan_importer::RhsHeader) -> ChannelGroup {
+    let channels = &header.board_adc_channels;
+    let mut group = ChannelGroup::new(channels.len());
     
-    for channel in &header.board_adc_channels {
-        let mut channel_dict = HashMap::new();
-        channel_dict.insert("native_channel_name".to_string(), channel.native_channel_name.clone());
-        channel_dict.insert("custom_channel_name".to_string(), channel.custom_channel_name.clone());
-        channel_dict.insert("native_order".to_string(), channel.native_order.to_string());
-        channel_dict.insert("custom_order".to_string(), channel.custom_order.to_string());
-        channel_dict.insert("board_stream".to_string(), channel.board_stream.to_string());
-        
-        // Add port information
-        channel_dict.insert("port_name".to_string(), channel.port_name.clone());
-        channel_dict.insert("port_prefix".to_string(), channel.port_prefix.clone());
-        channel_dict.insert("port_number".to_string(), channel.port_number.to_string());
-        
-        channels.push(channel_dict);
-    }
+    group.push_column("native_channel_name", Column::Text(channels.iter().map(|c| c.native_channel_name.clone()).collect()));
+    group.push_column("custom_channel_name", Column::Text(channels.iter().map(|c| c.custom_channel_name.clone()).collect()));
+    group.push_column("native_order", Column::Int(channels.iter().map(|c| c.native_order as i32).collect()));
+    group.push_column("custom_order", Column::Int(channels.iter().map(|c| c.custom_order as i32).collect()));
+    group.push_column("board_stream", Column::Int(channels.iter().map(|c| c.board_stream as i32).collect()));
     
-    channels
+    // Add port information
+    group.push_column("port_name", Column::Text(channels.iter().map(|c| c.port_name.clone()).collect()));
+    group.push_column("port_prefix", Column::Text(channels.iter().map(|c| c.port_prefix.clone()).collect()));
+    group.push_column("port_number", Column::Int(channels.iter().map(|c| c.port_number as i32).collect()));
+    
+    group
 }
 
-fn convert_board_dac_channels(header: &intan_importer::RhsHeader) -> Vec<HashMap<String, String>> {
-    let mut channels = Vec::new();
+fn convert_board_dac_channels(header: &intan_importer::RhsHeader) -> ChannelGroup {
+    let channels = &header.board_dac_channels;
+    let mut group = ChannelGroup::new(channels.len());
     
-    for channel in &header.board_dac_channels {
-        let mut channel_dict = HashMap::new();
-        channel_dict.insert("native_channel_name".to_string(), channel.native_channel_name.clone());
-        channel_dict.insert("custom_channel_name".to_string(), channel.custom_channel_name.clone());
-        channel_dict.insert("native_order".to_string(), channel.native_order.to_string());
-        channel_dict.insert("custom_order".to_string(), channel.custom_order.to_string());
-        channel_dict.insert("board_stream".to_string(), channel.board_stream.to_string());
-        
-        // Add port information
-        channel_dict.insert("port_name".to_string(), channel.port_name.clone());
-        channel_dict.insert("port_prefix".to_string(), channel.port_prefix.clone());
-        channel_dict.insert("port_number".to_string(), channel.port_number.to_string());
-        
-        channels.push(channel_dict);
-    }
+    group.push_column("native_channel_name", Column::Text(channels.iter().map(|c| c.native_channel_name.clone()).collect()));
+    group.push_column("custom_channel_name", Column::Text(channels.iter().map(|c| c.custom_channel_name.clone()).collect()));
+    group.push_column("native_order", Column::Int(channels.iter().map(|c| c.native_order as i32).collect()));
+    group.push_column("custom_order", Column::Int(channels.iter().map(|c| c.custom_order as i32).collect()));
+    group.push_column("board_stream", Column::Int(channels.iter().map(|c| c.board_stream as i32).collect()));
+    
+    // Add port information
+    group.push_column("port_name", Column::Text(channels.iter().map(|c| c.port_name.clone()).collect()));
+    group.push_column("port_prefix", Column::Text(channels.iter().map(|c| c.port_prefix.clone()).collect()));
+    group.push_column("port_number", Column::Int(channels.iter().map(|c| c.port_number as i32).collect()));
     
-    channels
+    group
 }
 
-fn convert_board_dig_in_channels(header: &intan_importer::RhsHeader) -> Vec<HashMap<String, String>> {
-    let mut channels = Vec::new();
+fn convert_board_dig_in_channels(header: &intan_importer::RhsHeader) -> ChannelGroup {
+    let channels = &header.board_dig_in_channels;
+    let mut group = ChannelGroup::new(channels.len());
     
-    for channel in &header.board_dig_in_channels {
-        let mut channel_dict = HashMap::new();
-        channel_dict.insert("native_channel_name".to_string(), channel.native_channel_name.clone());
-        channel_dict.insert("custom_channel_name".to_string(), channel.custom_channel_name.clone());
-        channel_dict.insert("native_order".to_string(), channel.native_order.to_string());
-        channel_dict.insert("custom_order".to_string(), channel.custom_order.to_string());
-        channel_dict.insert("board_stream".to_string(), channel.board_stream.to_string());
-        
-        // Add port information
-        channel_dict.insert("port_name".to_string(), channel.port_name.clone());
-        channel_dict.insert("port_prefix".to_string(), channel.port_prefix.clone());
-        channel_dict.insert("port_number".to_string(), channel.port_number.to_string());
-        
-        channels.push(channel_dict);
-    }
+    group.push_column("native_channel_name", Column::Text(channels.iter().map(|c| c.native_channel_name.clone()).collect()));
+    group.push_column("custom_channel_name", Column::Text(channels.iter().map(|c| c.custom_channel_name.clone()).collect()));
+    group.push_column("native_order", Column::Int(channels.iter().map(|c| c.native_order as i32).collect()));
+    group.push_column("custom_order", Column::Int(channels.iter().map(|c| c.custom_order as i32).collect()));
+    group.push_column("board_stream", Column::Int(channels.iter().map(|c| c.board_stream as i32).collect()));
+    
+    // Add port information
+    group.push_column("port_name", Column::Text(channels.iter().map(|c| c.port_name.clone()).collect()));
+    group.push_column("port_prefix", Column::Text(channels.iter().map(|c| c.port_prefix.clone()).collect()));
+    group.push_column("port_number", Column::Int(channels.iter().map(|c| c.port_number as i32).collect()));
     
-    channels
+    group
 }
 
-fn convert_board_dig_out_channels(header: &intan_importer::RhsHeader) -> Vec<HashMap<String, String>> {
-    let mut channels = Vec::new();
+fn convert_board_dig_out_channels(header: &intan_importer::RhsHeader) -> ChannelGroup {
+    let channels = &header.board_dig_out_channels;
+    let mut group = ChannelGroup::new(channels.len());
     
-    for channel in &header.board_dig_out_channels {
-        let mut channel_dict = HashMap::new();
-        channel_dict.insert("native_channel_name".to_string(), channel.native_channel_name.clone());
-        channel_dict.insert("custom_channel_name".to_string(), channel.custom_channel_name.clone());
-        channel_dict.insert("native_order".to_string(), channel.native_order.to_string());
-        channel_dict.insert("custom_order".to_string(), channel.custom_order.to_string());
-        channel_dict.insert("board_stream".to_string(), channel.board_stream.to_string());
-        
-        // Add port information
-        channel_dict.insert("port_name".to_string(), channel.port_name.clone());
-        channel_dict.insert("port_prefix".to_string(), channel.port_prefix.clone());
-        channel_dict.insert("port_number".to_string(), channel.port_number.to_string());
-        
-        channels.push(channel_dict);
-    }
+    group.push_column("native_channel_name", Column::Text(channels.iter().map(|c| c.native_channel_name.clone()).collect()));
+    group.push_column("custom_channel_name", Column::Text(channels.iter().map(|c| c.custom_channel_name.clone()).collect()));
+    group.push_column("native_order", Column::Int(channels.iter().map(|c| c.native_order as i32).collect()));
+    group.push_column("custom_order", Column::Int(channels.iter().map(|c| c.custom_order as i32).collect()));
+    group.push_column("board_stream", Column::Int(channels.iter().map(|c| c.board_stream as i32).collect()));
     
-    channels
+    // Add port information
+    group.push_column("port_name", Column::Text(channels.iter().map(|c| c.port_name.clone()).collect()));
+    group.push_column("port_prefix", Column::Text(channels.iter().map(|c| c.port_prefix.clone()).collect()));
+    group.push_column("port_number", Column::Int(channels.iter().map(|c| c.port_number as i32).collect()));
+    
+    group
 }
 
 fn convert_spike_triggers(header: &intan_importer::RhsHeader) -> Vec<HashMap<String, f32>> {
@@ -317,87 +1007,121 @@ fn convert_spike_triggers(header: &intan_importer::RhsHeader) -> Vec<HashMap<Str
     triggers
 }
 
+/// Map each custom channel name to its group and index within that group.
+///
+/// If a name appears more than once, the first occurrence wins, matching a
+/// front-to-back scan of the groups.
+fn build_channel_index(groups: &[(&'static str, &ChannelGroup)]) -> HashMap<String, (&'static str, usize)> {
+    let mut index = HashMap::new();
+    
+    for &(group_name, group) in groups {
+        if let Some(names) = group.text("custom_channel_name") {
+            for (i, name) in names.iter().enumerate() {
+                index.entry(name.clone()).or_insert((group_name, i));
+            }
+        }
+    }
+    
+    index
+}
+
 struct StimDataConversion {
-    stim_data: Vec<Vec<f32>>,
-    compliance_limit_data: Vec<Vec<bool>>,
-    charge_recovery_data: Vec<Vec<bool>>,
-    amp_settle_data: Vec<Vec<bool>>,
+    stim_data: Array2<i16>,
+    compliance_limit_data: Array2<bool>,
+    charge_recovery_data: Array2<bool>,
+    amp_settle_data: Array2<bool>,
+}
+
+/// Allocate a channels x samples array and fill its rows in parallel.
+///
+/// `fill_row` is called once per channel with the channel index and that
+/// channel's row. Rows are disjoint slices of one contiguous buffer, so
+/// channels are converted concurrently across the Rayon thread pool.
+fn fill_rows<T, F>(num_channels: usize, num_samples: usize, fill_row: F) -> Array2<T>
+where
+    T: Clone + Default + Send,
+    F: Fn(usize, &mut [T]) + Sync,
+{
+    // `from_elem` with a zero-valued primitive allocates through calloc, so the
+    // buffer starts as untouched zero pages instead of being written once
+    // with defaults and then overwritten by `fill_row`
+    let mut result = Array2::from_elem((num_channels, num_samples), T::default());
+    
+    if num_samples > 0 {
+        result
+            .as_slice_mut()
+            .expect("newly allocated array is contiguous")
+            .par_chunks_mut(num_samples)
+            .enumerate()
+            .for_each(|(i, row)| fill_row(i, row));
+    }
+    
+    result
 }
 
-fn convert_amplifier_data(data: &intan_importer::RhsData) -> Vec<Vec<f32>> {
-    if let Some(ref amp_data) = data.amplifier_data {
+fn convert_amplifier_data(data: &mut intan_importer::RhsData) -> Array2<u16> {
+    if let Some(amp_data) = data.amplifier_data.take() {
         let num_channels = amp_data.shape()[0];
         let num_samples = amp_data.shape()[1];
         
-        let mut result = vec![vec![0.0; num_samples]; num_channels];
-        
-        for i in 0..num_channels {
-            for j in 0..num_samples {
-                // Scale to microvolts: 0.195 * (sample - 32768)
-                let sample = amp_data[[i, j]];
-                result[i][j] = 0.195 * (sample as i32 - 32768) as f32;
+        fill_rows(num_channels, num_samples, |i, row| {
+            for (j, value) in row.iter_mut().enumerate() {
+                *value = amp_data[[i, j]] as u16;
             }
-        }
-        
-        result
+        })
     } else {
-        Vec::new()
+        Array2::zeros((0, 0))
     }
 }
 
-fn convert_dc_amplifier_data(data: &intan_importer::RhsData) -> Vec<Vec<f32>> {
-    if let Some(ref dc_amp_data) = data.dc_amplifier_data {
+fn convert_dc_amplifier_data(data: &mut intan_importer::RhsData) -> Array2<u16> {
+    if let Some(dc_amp_data) = data.dc_amplifier_data.take() {
         let num_channels = dc_amp_data.shape()[0];
         let num_samples = dc_amp_data.shape()[1];
         
-        let mut result = vec![vec![0.0; num_samples]; num_channels];
-        
-        for i in 0..num_channels {
-            for j in 0..num_samples {
-                // Scale to volts: -0.01923 * (sample - 512)
-                let sample = dc_amp_data[[i, j]];
-                result[i][j] = -0.01923 * (sample as i32 - 512) as f32;
+        fill_rows(num_channels, num_samples, |i, row| {
+            for (j, value) in row.iter_mut().enumerate() {
+                *value = dc_amp_data[[i, j]] as u16;
             }
-        }
-        
-        result
+        })
     } else {
-        Vec::new()
+        Array2::zeros((0, 0))
     }
 }
 
-fn convert_stim_data(data: &intan_importer::RhsData) -> StimDataConversion {
-    if let Some(ref stim_data_arr) = data.stim_data {
+fn convert_stim_data(data: &mut intan_importer::RhsData) -> StimDataConversion {
+    if let Some(stim_data_arr) = data.stim_data.take() {
         let num_channels = stim_data_arr.shape()[0];
         let num_samples = stim_data_arr.shape()[1];
         
-        let mut stim_data = vec![vec![0.0; num_samples]; num_channels];
-        let mut compliance_limit_data = vec![vec![false; num_samples]; num_channels];
-        let mut charge_recovery_data = vec![vec![false; num_samples]; num_channels];
-        let mut amp_settle_data = vec![vec![false; num_samples]; num_channels];
-        
-        for i in 0..num_channels {
-            for j in 0..num_samples {
-                let sample = stim_data_arr[[i, j]];
-                
-                // Extract compliance limit bit (bit 15)
-                compliance_limit_data[i][j] = (sample & 0x8000) != 0;
-                
-                // Extract charge recovery bit (bit 14)
-                charge_recovery_data[i][j] = (sample & 0x4000) != 0;
-                
-                // Extract amp settle bit (bit 13)
-                amp_settle_data[i][j] = (sample & 0x2000) != 0;
-                
-                // Extract polarity bit (bit 8)
-                let polarity = if (sample & 0x0100) != 0 { -1i32 } else { 1i32 };
-                
-                // Extract current amplitude (bits 0-7)
-                let current_amp = (sample & 0x00FF) as i32;
-                
-                // Combine polarity and amplitude
-                stim_data[i][j] = (current_amp * polarity) as f32;
-            }
+        let mut stim_data = Array2::<i16>::zeros((num_channels, num_samples));
+        let mut compliance_limit_data = Array2::<bool>::from_elem((num_channels, num_samples), false);
+        let mut charge_recovery_data = Array2::<bool>::from_elem((num_channels, num_samples), false);
+        let mut amp_settle_data = Array2::<bool>::from_elem((num_channels, num_samples), false);
+        
+        if num_samples > 0 {
+            // Decode all four outputs from a single read of each raw sample,
+            // with one Rayon task per channel writing its own rows
+            let stim_rows = stim_data.as_slice_mut().expect("newly allocated array is contiguous");
+            let compliance_limit_rows = compliance_limit_data.as_slice_mut().expect("newly allocated array is contiguous");
+            let charge_recovery_rows = charge_recovery_data.as_slice_mut().expect("newly allocated array is contiguous");
+            let amp_settle_rows = amp_settle_data.as_slice_mut().expect("newly allocated array is contiguous");
+            
+            stim_rows
+                .par_chunks_mut(num_samples)
+                .zip(compliance_limit_rows.par_chunks_mut(num_samples))
+                .zip(charge_recovery_rows.par_chunks_mut(num_samples))
+                .zip(amp_settle_rows.par_chunks_mut(num_samples))
+                .enumerate()
+                .for_each(|(i, (((stim_row, compliance_limit_row), charge_recovery_row), amp_settle_row))| {
+                    for j in 0..num_samples {
+                        let sample = decode_stim_word(stim_data_arr[[i, j]] as u16);
+                        stim_row[j] = sample.current;
+                        compliance_limit_row[j] = sample.compliance_limit;
+                        charge_recovery_row[j] = sample.charge_recovery;
+                        amp_settle_row[j] = sample.amp_settle;
+                    }
+                });
         }
         
         StimDataConversion {
@@ -408,127 +1132,318 @@ fn convert_stim_data(data: &intan_importer::RhsData) -> StimDataConversion {
         }
     } else {
         StimDataConversion {
-            stim_data: Vec::new(),
-            compliance_limit_data: Vec::new(),
-            charge_recovery_data: Vec::new(),
-            amp_settle_data: Vec::new(),
+            stim_data: Array2::zeros((0, 0)),
+            compliance_limit_data: Array2::from_elem((0, 0), false),
+            charge_recovery_data: Array2::from_elem((0, 0), false),
+            amp_settle_data: Array2::from_elem((0, 0), false),
         }
     }
 }
 
-fn convert_board_adc_data(data: &intan_importer::RhsData) -> Vec<Vec<f32>> {
-    if let Some(ref adc_data) = data.board_adc_data {
+/// One stimulation sample split into its fields.
+#[derive(Debug, PartialEq)]
+struct StimSample {
+    current: i16,
+    compliance_limit: bool,
+    charge_recovery: bool,
+    amp_settle: bool,
+}
+
+/// Decode a raw stimulation word.
+fn decode_stim_word(word: u16) -> StimSample {
+    // Extract polarity bit (bit 8)
+    let polarity = if (word & 0x0100) != 0 { -1i16 } else { 1i16 };
+    
+    // Extract current amplitude (bits 0-7)
+    let current_amp = (word & 0x00FF) as i16;
+    
+    StimSample {
+        // Combine polarity and amplitude; the signed step count is within
+        // +/-255, so it fits in 16 bits
+        current: current_amp * polarity,
+        // Extract compliance limit bit (bit 15)
+        compliance_limit: (word & 0x8000) != 0,
+        // Extract charge recovery bit (bit 14)
+        charge_recovery: (word & 0x4000) != 0,
+        // Extract amp settle bit (bit 13)
+        amp_settle: (word & 0x2000) != 0,
+    }
+}
+
+fn convert_board_adc_data(data: &mut intan_importer::RhsData) -> Array2<u16> {
+    if let Some(adc_data) = data.board_adc_data.take() {
         let num_channels = adc_data.shape()[0];
         let num_samples = adc_data.shape()[1];
         
         if num_channels == 0 {
-            return Vec::new();
+            return Array2::zeros((0, 0));
         }
         
-        let mut result = vec![vec![0.0; num_samples]; num_channels];
-        
-        for i in 0..num_channels {
-            for j in 0..num_samples {
-                // Scale to volts: 312.5e-6 * (sample - 32768)
-                let sample = adc_data[[i, j]];
-                result[i][j] = 312.5e-6 * (sample as i32 - 32768) as f32;
+        fill_rows(num_channels, num_samples, |i, row| {
+            for (j, value) in row.iter_mut().enumerate() {
+                *value = adc_data[[i, j]] as u16;
             }
-        }
-        
-        result
+        })
     } else {
-        Vec::new()
+        Array2::zeros((0, 0))
     }
 }
 
-fn convert_board_dac_data(data: &intan_importer::RhsData) -> Vec<Vec<f32>> {
-    if let Some(ref dac_data) = data.board_dac_data {
+fn convert_board_dac_data(data: &mut intan_importer::RhsData) -> Array2<u16> {
+    if let Some(dac_data) = data.board_dac_data.take() {
         let num_channels = dac_data.shape()[0];
         let num_samples = dac_data.shape()[1];
         
         if num_channels == 0 {
-            return Vec::new();
+            return Array2::zeros((0, 0));
         }
         
-        let mut result = vec![vec![0.0; num_samples]; num_channels];
-        
-        for i in 0..num_channels {
-            for j in 0..num_samples {
-                // Scale to volts: 312.5e-6 * (sample - 32768)
-                let sample = dac_data[[i, j]];
-                result[i][j] = 312.5e-6 * (sample as i32 - 32768) as f32;
+        fill_rows(num_channels, num_samples, |i, row| {
+            for (j, value) in row.iter_mut().enumerate() {
+                *value = dac_data[[i, j]] as u16;
             }
-        }
-        
-        result
+        })
     } else {
-        Vec::new()
+        Array2::zeros((0, 0))
     }
 }
 
-fn convert_board_dig_in_raw(data: &intan_importer::RhsData, header: &intan_importer::RhsHeader) -> Vec<Vec<bool>> {
-    let num_channels = header.board_dig_in_channels.len();
-    if num_channels == 0 {
-        return Vec::new();
+fn convert_board_dig_in_raw(data: &mut intan_importer::RhsData) -> Array1<u16> {
+    // Keep the packed words as recorded: bit `native_order` of each word is
+    // the state of that channel, so all channels share one 16-bit sample
+    if let Some(dig_in_raw) = data.board_dig_in_raw.take() {
+        dig_in_raw.iter().map(|&sample| sample as u16).collect()
+    } else {
+        Array1::zeros(0)
     }
+}
+
+fn convert_board_dig_out_raw(data: &mut intan_importer::RhsData) -> Array1<u16> {
+    // Keep the packed words as recorded: bit `native_order` of each word is
+    // the state of that channel, so all channels share one 16-bit sample
+    if let Some(dig_out_raw) = data.board_dig_out_raw.take() {
+        dig_out_raw.iter().map(|&sample| sample as u16).collect()
+    } else {
+        Array1::zeros(0)
+    }
+}
+
+/// Register the Python module
+#[pymodule]
+fn neuro_import(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(load_rhs_file, py)?)?;
+    m.add_function(wrap_pyfunction!(load_rhs_files, py)?)?;
+    m.add_class::<RHSResult>()?;
+    m.add_class::<ChannelGroup>()?;
     
-    if let Some(ref dig_in_raw) = data.board_dig_in_raw {
-        let num_samples = dig_in_raw.len();
-        if num_samples == 0 {
-            return Vec::new();
-        }
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn unpack_digital_words_handles_partial_tile_and_masks() {
+        // Not a multiple of the tile size, so the last tile is partial
+        let num_samples = DIGITAL_TILE_SAMPLES * 2 + 37;
+        let words: Array1<u16> = (0..num_samples).map(|j| (j * 7919) as u16).collect();
+        let masks = [1u16 << 3, 1 << 0, 1 << 15];
         
-        let mut result = vec![vec![false; num_samples]; num_channels];
+        let unpacked = unpack_digital_words(words.view(), &masks);
         
-        for i in 0..num_channels {
-            let native_order = header.board_dig_in_channels[i].native_order;
-            
-            for j in 0..num_samples {
-                let sample = dig_in_raw[j];
-                result[i][j] = (sample & (1 << native_order)) != 0;
+        assert_eq!(unpacked.dim(), (masks.len(), num_samples));
+        for (i, &mask) in masks.iter().enumerate() {
+            for (j, &word) in words.iter().enumerate() {
+                assert_eq!(unpacked[[i, j]], word & mask != 0, "channel {}, sample {}", i, j);
             }
         }
+    }
+
+    #[test]
+    fn scale_samples_matches_reference_formulas() {
+        let samples: Array1<u16> = [0u16, 1, 511, 512, 513, 32767, 32768, 32769, 65535].into_iter().collect();
+        let cases: [(Scaling, fn(u16) -> f32); 3] = [
+            (AMPLIFIER_SCALING, |s| 0.195 * (s as i32 - 32768) as f32),
+            (DC_AMPLIFIER_SCALING, |s| -0.01923 * (s as i32 - 512) as f32),
+            (BOARD_ANALOG_SCALING, |s| 312.5e-6 * (s as i32 - 32768) as f32),
+        ];
         
-        result
-    } else {
-        Vec::new()
+        for (scaling, reference) in cases {
+            // Contiguous input
+            let mut output = vec![f32::NAN; samples.len()];
+            scale_samples(samples.view(), &mut output, scaling);
+            let expected: Vec<f32> = samples.iter().map(|&s| reference(s)).collect();
+            assert_eq!(output, expected);
+            
+            // Strided input takes the non-slice path
+            let strided = samples.slice(numpy::ndarray::s![..;2]);
+            let mut output = vec![f32::NAN; strided.len()];
+            scale_samples(strided, &mut output, scaling);
+            let expected: Vec<f32> = strided.iter().map(|&s| reference(s)).collect();
+            assert_eq!(output, expected);
+        }
     }
-}
 
-fn convert_board_dig_out_raw(data: &intan_importer::RhsData, header: &intan_importer::RhsHeader) -> Vec<Vec<bool>> {
-    let num_channels = header.board_dig_out_channels.len();
-    if num_channels == 0 {
-        return Vec::new();
+    #[test]
+    fn decode_stim_word_splits_fields() {
+        assert_eq!(
+            decode_stim_word(0x0000),
+            StimSample { current: 0, compliance_limit: false, charge_recovery: false, amp_settle: false },
+        );
+        assert_eq!(
+            decode_stim_word(0x00FF),
+            StimSample { current: 255, compliance_limit: false, charge_recovery: false, amp_settle: false },
+        );
+        assert_eq!(
+            decode_stim_word(0x01FF),
+            StimSample { current: -255, compliance_limit: false, charge_recovery: false, amp_settle: false },
+        );
+        assert_eq!(
+            decode_stim_word(0x8000 | 0x0105),
+            StimSample { current: -5, compliance_limit: true, charge_recovery: false, amp_settle: false },
+        );
+        assert_eq!(
+            decode_stim_word(0x4000 | 0x2000 | 0x0010),
+            StimSample { current: 16, compliance_limit: false, charge_recovery: true, amp_settle: true },
+        );
+        // Bits 9-12 carry no stimulation fields
+        assert_eq!(decode_stim_word(0x1E00), decode_stim_word(0x0000));
     }
-    
-    if let Some(ref dig_out_raw) = data.board_dig_out_raw {
-        let num_samples = dig_out_raw.len();
-        if num_samples == 0 {
-            return Vec::new();
-        }
+
+    #[test]
+    fn digital_masks_rejects_out_of_range_orders() {
+        assert_eq!(digital_masks([0, 4, 15].into_iter()), Ok(vec![0x0001, 0x0010, 0x8000]));
+        assert!(digital_masks([16].into_iter()).is_err());
+        assert!(digital_masks([-1].into_iter()).is_err());
+    }
+
+    fn group(names: &[&str]) -> ChannelGroup {
+        let mut group = ChannelGroup::new(names.len());
+        group.push_column("custom_channel_name", Column::Text(names.iter().map(|name| name.to_string()).collect()));
+        group
+    }
+
+    #[test]
+    fn build_channel_index_keeps_first_occurrence() {
+        let amplifier = group(&["A-000", "A-001", "A-000"]);
+        let adc = group(&["ADC-0", "A-001"]);
         
-        let mut result = vec![vec![false; num_samples]; num_channels];
+        let index = build_channel_index(&[("amplifier_channels", &amplifier), ("board_adc_channels", &adc)]);
+        
+        assert_eq!(index.len(), 3);
+        assert_eq!(index["A-000"], ("amplifier_channels", 0));
+        assert_eq!(index["A-001"], ("amplifier_channels", 1));
+        assert_eq!(index["ADC-0"], ("board_adc_channels", 0));
+    }
+
+    #[test]
+    fn resolve_index_counts_negative_indices_from_the_end() {
+        assert_eq!(resolve_index(0, 3), Some(0));
+        assert_eq!(resolve_index(2, 3), Some(2));
+        assert_eq!(resolve_index(3, 3), None);
+        assert_eq!(resolve_index(-1, 3), Some(2));
+        assert_eq!(resolve_index(-3, 3), Some(0));
+        assert_eq!(resolve_index(-4, 3), None);
+        assert_eq!(resolve_index(0, 0), None);
+        assert_eq!(resolve_index(-1, 0), None);
+    }
+
+    #[test]
+    fn slice_positions_follow_normalized_slice_indices() {
+        let positions = |start, step, count| slice_positions(start, step, count).collect::<Vec<_>>();
+        
+        // group[1:4] of 5 channels
+        assert_eq!(positions(1, 1, 3), [1, 2, 3]);
+        // group[-2:] of 5 channels
+        assert_eq!(positions(3, 1, 2), [3, 4]);
+        // group[::2] of 5 channels
+        assert_eq!(positions(0, 2, 3), [0, 2, 4]);
+        // group[::-1] of 5 channels
+        assert_eq!(positions(4, -1, 5), [4, 3, 2, 1, 0]);
+        // group[3::-2] of 5 channels
+        assert_eq!(positions(3, -2, 2), [3, 1]);
+        // group[10:] of 5 channels
+        assert_eq!(positions(5, 1, 0), Vec::<usize>::new());
+    }
+
+    #[test]
+    fn convert_files_keeps_input_order_and_maps_errors() {
+        let filenames: Vec<String> = (0..7)
+            .map(|i| if i % 3 == 0 { format!("missing-{}", i) } else { format!("file-{}", i) })
+            .collect();
+        let convert = |filename: &str| {
+            if filename.starts_with("missing") {
+                Err(format!("cannot open {}", filename))
+            } else {
+                Ok(filename.to_uppercase())
+            }
+        };
         
-        for i in 0..num_channels {
-            let native_order = header.board_dig_out_channels[i].native_order;
+        // Fewer workers than files, one worker, and more workers than files
+        for max_workers in [2, 1, 16] {
+            let converted = convert_files(&filenames, max_workers, convert);
             
-            for j in 0..num_samples {
-                let sample = dig_out_raw[j];
-                result[i][j] = (sample & (1 << native_order)) != 0;
+            assert_eq!(converted.len(), filenames.len());
+            for (result, filename) in converted.iter().zip(&filenames) {
+                match result {
+                    Ok(value) => assert_eq!(*value, filename.to_uppercase()),
+                    Err(e) => assert_eq!(*e, format!("cannot open {}", filename)),
+                }
             }
         }
         
-        result
-    } else {
-        Vec::new()
+        assert!(convert_files(&[], 4, convert).is_empty());
     }
-}
 
-/// Register the Python module
-#[pymodule]
-fn neuro_import(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
-    m.add_function(wrap_pyfunction!(load_rhs_file, py)?)?;
-    m.add_class::<RHSResult>()?;
-    
-    Ok(())
-}
\ No newline at end of file
+    #[test]
+    fn convert_files_reports_nonexistent_paths() {
+        let filenames: Vec<String> = (0..3).map(|i| format!("/nonexistent/recording-{}.rhs", i)).collect();
+        
+        for max_workers in [2, 8] {
+            let converted = convert_files(&filenames, max_workers, convert_file);
+            assert_eq!(converted.len(), filenames.len());
+            assert!(converted.iter().all(Result::is_err));
+        }
+    }
+
+    #[test]
+    fn available_fields_lists_only_blocks_with_data() {
+        assert!(DataSizes::default().available_fields().is_empty());
+        
+        let sizes = DataSizes {
+            timestamps: 100,
+            amplifier: 400,
+            stim: 400,
+            // A port with channels but no words, and one with words but no channels
+            board_dig_in: DigitalPortSize { channels: 2, words: 0, decodable: true },
+            board_dig_out: DigitalPortSize { channels: 0, words: 100, decodable: true },
+            ..DataSizes::default()
+        };
+        assert_eq!(
+            sizes.available_fields(),
+            [
+                "t", "timestamps",
+                "amplifier_data", "amplifier_data_raw",
+                "stim_data", "compliance_limit_data", "charge_recovery_data", "amp_settle_data",
+            ],
+        );
+        
+        let sizes = DataSizes {
+            board_adc: 10,
+            board_dac: 10,
+            board_dig_in: DigitalPortSize { channels: 2, words: 100, decodable: true },
+            board_dig_out: DigitalPortSize { channels: 1, words: 100, decodable: false },
+            ..DataSizes::default()
+        };
+        assert_eq!(
+            sizes.available_fields(),
+            [
+                "board_adc_data", "board_adc_data_raw",
+                "board_dac_data", "board_dac_data_raw",
+                "board_dig_in_data", "board_dig_in_raw",
+                "board_dig_out_raw",
+            ],
+        );
+    }
+}